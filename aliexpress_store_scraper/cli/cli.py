@@ -25,6 +25,14 @@ from typing import Any, Dict, List, Optional
 
 from aliexpress_store_scraper.clients.aliexpress_client import AliExpressClient
 
+# Use orjson for JSON output if available (C-level, much faster than stdlib)
+try:
+    import orjson
+
+    orjson_available = True
+except ImportError:
+    orjson_available = False
+
 
 def extract_product_id_from_url(url: str) -> Optional[str]:
     """
@@ -118,10 +126,12 @@ def format_output_text(product_data: Dict[str, Any], verbose: bool = False) -> s
 
 def format_output_json(product_data: Dict[str, Any], pretty: bool = True) -> str:
     """Format product data as JSON."""
+    if orjson_available:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        return orjson.dumps(product_data, option=option).decode()
     if pretty:
         return json.dumps(product_data, indent=2, ensure_ascii=False)
-    else:
-        return json.dumps(product_data, ensure_ascii=False)
+    return json.dumps(product_data, ensure_ascii=False)
 
 
 def main():
@@ -219,17 +229,14 @@ To get a fresh cookie:
 
         # Output results
         if args.raw:
-            print(json.dumps(product_data, indent=2, ensure_ascii=False))
+            print(format_output_json(product_data, pretty=True))
         elif args.json or args.pretty_json:
             print(format_output_json(product_data, pretty=True))
         else:
             print(format_output_text(product_data, verbose=args.verbose))
 
-        # Exit with appropriate code
-        if product_data.get("success"):
-            sys.exit(0)
-        else:
-            sys.exit(1)
+        # Exit with appropriate code; bool is an int, so no branch needed
+        sys.exit(not product_data.get("success"))
 
     except Exception as e:
         print(f"❌ Unexpected error: {e}", file=sys.stderr)
@@ -40,24 +40,81 @@ from aliexpress_store_scraper.processors.core_seller_extractor import (
     CoreSellerExtractor,
 )
 
+# Use orjson for payload serialization if available (C-level, much faster)
+try:
+    import orjson
+
+    def _json_dumps_compact(obj):
+        return orjson.dumps(obj).decode()
+except ImportError:
+
+    def _json_dumps_compact(obj):
+        return json.dumps(obj, separators=(",", ":"))
+
+
+# Module-level extractor singleton: construction work is paid once even
+# when get_seller_info runs in a batch loop
+_EXTRACTOR = None
+
+
+def _get_extractor():
+    global _EXTRACTOR
+    if _EXTRACTOR is None:
+        _EXTRACTOR = CoreSellerExtractor()
+    return _EXTRACTOR
+
+
+# Constant MTOP request payload, serialized once at import: the ext blob
+# and locale fields never vary per product, only productId does
+_EXT_JSON = _json_dumps_compact(
+    {
+        "foreverRandomToken": "1b30c08e93b84668bac6ea9a4e750a45",
+        "site": "usa",
+        "crawler": False,
+        "x-m-biz-bx-region": "",
+        "signedIn": True,
+        "host": "www.aliexpress.us",
+    }
+)
+
+_BASE_DATA = {
+    "_lang": "en_US",
+    "_currency": "USD",
+    "country": "US",
+    "province": "922878890000000000",
+    "city": "922878897869000000",
+    "channel": "",
+    "pdp_ext_f": "",
+    "pdpNPI": "",
+    "sourceType": "",
+    "clientType": "pc",
+    "ext": _EXT_JSON,
+}
+
+# Explicit product-ID URL shapes fused into one alternation, compiled once
+# at import. The bare-number fallback stays a separate pattern consulted
+# only when no explicit shape matches: folding it into the alternation
+# would let any earlier long digit run (e.g. an affiliate trace key) win on
+# match position over a later /item/<id> segment. It is bounded to 13-19
+# digits and fenced with digit lookarounds so the engine fails fast at
+# interior digit positions instead of re-walking every offset of a run.
+_PID_RE = re.compile(r"/item/(\d+)(?:\.html)?|product/(\d+)")
+_PID_FALLBACK_RE = re.compile(r"(?<!\d)(\d{13,19})(?!\d)")
+
 
 def extract_product_id(url_or_id):
     """Extract product ID from URL or return if already an ID."""
     if url_or_id.isdigit():
         return url_or_id
 
-    # Extract from various URL formats
-    patterns = [
-        r"/item/(\d+)\.html",
-        r"/item/(\d+)",
-        r"product/(\d+)",
-        r"(\d{13,})",  # Long numeric ID
-    ]
+    # Explicit URL shapes first; bare digit runs only as a last resort
+    match = _PID_RE.search(url_or_id)
+    if match:
+        return match.group(1) or match.group(2)
 
-    for pattern in patterns:
-        match = re.search(pattern, url_or_id)
-        if match:
-            return match.group(1)
+    match = _PID_FALLBACK_RE.search(url_or_id)
+    if match:
+        return match.group(1)
 
     return None
 
@@ -68,7 +125,7 @@ def get_seller_info(product_id, manual_cookie=None):
     print(f"🔍 Extracting core seller fields for product: {product_id}")
 
     client = EnhancedAliExpressClient()
-    extractor = CoreSellerExtractor()
+    extractor = _get_extractor()
 
     try:
         # Get API response
@@ -77,70 +134,20 @@ def get_seller_info(product_id, manual_cookie=None):
             api_result = client.call_api(
                 cookie_string=manual_cookie,
                 api="mtop.aliexpress.pdp.pc.query",
-                data={
-                    "productId": product_id,
-                    "_lang": "en_US",
-                    "_currency": "USD",
-                    "country": "US",
-                    "province": "922878890000000000",
-                    "city": "922878897869000000",
-                    "channel": "",
-                    "pdp_ext_f": "",
-                    "pdpNPI": "",
-                    "sourceType": "",
-                    "clientType": "pc",
-                    "ext": json.dumps(
-                        {
-                            "foreverRandomToken": "1b30c08e93b84668bac6ea9a4e750a45",
-                            "site": "usa",
-                            "crawler": False,
-                            "x-m-biz-bx-region": "",
-                            "signedIn": True,
-                            "host": "www.aliexpress.us",
-                        }
-                    ),
-                },
+                data={**_BASE_DATA, "productId": product_id},
             )
         else:
             print("🤖 Using automated cookies...")
-            product_result = client.get_product_with_auto_cookies(product_id)
+            # One network round-trip: the raw API response rides along with
+            # the product result instead of being re-fetched
+            product_result = client.get_product_with_auto_cookies(
+                product_id, return_raw=True
+            )
             if not product_result.get("success"):
                 return {
                     "error": f"Failed to get product: {product_result.get('error')}"
                 }
-
-            # We need the raw API response, so make another call
-            cookie_result = client._get_valid_cookies()
-            if not cookie_result["success"]:
-                return {"error": f"Failed to get cookies: {cookie_result.get('error')}"}
-
-            api_result = client.call_api(
-                cookie_string=cookie_result["cookies"],
-                api="mtop.aliexpress.pdp.pc.query",
-                data={
-                    "productId": product_id,
-                    "_lang": "en_US",
-                    "_currency": "USD",
-                    "country": "US",
-                    "province": "922878890000000000",
-                    "city": "922878897869000000",
-                    "channel": "",
-                    "pdp_ext_f": "",
-                    "pdpNPI": "",
-                    "sourceType": "",
-                    "clientType": "pc",
-                    "ext": json.dumps(
-                        {
-                            "foreverRandomToken": "1b30c08e93b84668bac6ea9a4e750a45",
-                            "site": "usa",
-                            "crawler": False,
-                            "x-m-biz-bx-region": "",
-                            "signedIn": True,
-                            "host": "www.aliexpress.us",
-                        }
-                    ),
-                },
-            )
+            api_result = product_result["_raw_api"]
 
         if not api_result.get("success"):
             return {"error": f"API call failed: {api_result.get('error')}"}
@@ -164,6 +171,12 @@ def get_seller_info(product_id, manual_cookie=None):
         return {"error": f"Extraction failed: {str(e)}"}
 
 
+def _trunc(value, limit=60):
+    """Convert to str once and clip with a trailing ellipsis if too long."""
+    s = value if type(value) is str else str(value)
+    return s if len(s) <= limit else s[: limit - 3] + "..."
+
+
 def print_results(result):
     """Print formatted results."""
 
@@ -201,9 +214,8 @@ def print_results(result):
             # Format specific fields
             if field == "seller_rating":
                 value = f"{value}/100"
-            elif field in ["seller_profile_picture", "seller_profile_url"]:
-                if len(str(value)) > 70:
-                    value = str(value)[:67] + "..."
+            elif field in ("seller_profile_picture", "seller_profile_url"):
+                value = _trunc(value, 70)
 
             print(f"  {label:15}: {value}")
 
@@ -217,10 +229,7 @@ def print_results(result):
             print(f"{category.replace('_', ' ').title()}:")
             for key, value in data.items():
                 clean_key = key.replace("_", " ").title()
-                clean_value = str(value)
-                if len(clean_value) > 60:
-                    clean_value = clean_value[:57] + "..."
-                print(f"  • {clean_key}: {clean_value}")
+                print(f"  • {clean_key}: {_trunc(value)}")
             print()
 
 
@@ -241,7 +250,7 @@ def show_demo():
     print()
 
     # Demo with sample data
-    extractor = CoreSellerExtractor()
+    extractor = _get_extractor()
 
     sample_api = {
         "data": {
@@ -36,11 +36,39 @@ import re
 import sys
 import uuid
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-from aliexpress_store_scraper.clients.enhanced_aliexpress_client import (
-    EnhancedAliExpressClient,
-)
+if TYPE_CHECKING:
+    from aliexpress_store_scraper.clients.enhanced_aliexpress_client import (
+        EnhancedAliExpressClient,
+    )
+
+# Use orjson for JSON output if available (C-level, much faster than stdlib)
+try:
+    import orjson
+
+    orjson_available = True
+except ImportError:
+    orjson_available = False
+
+# Explicit product-ID URL shapes fused into one alternation, compiled once
+# at import: "item/<id>" covers the /item/ and bare-item variants (with or
+# without .html) and "/<id>.html" catches trailing-ID URLs. The bare digit
+# run stays a separate last-resort pattern: inside the alternation, match
+# position would let an earlier trace-key digit run shadow a later
+# item/<id> segment. It is bounded to 13-19 digits and fenced with digit
+# lookarounds, matching core_seller_cli, so the engine fails fast at
+# interior digit positions.
+_ID_RE = re.compile(r"item/(\d+)|/(\d+)\.html")
+_ID_FALLBACK_RE = re.compile(r"(?<!\d)(\d{13,19})(?!\d)")
+
+# Batch inputs split on comma or newline
+_BATCH_SPLIT = re.compile(r"[,\n]")
+
+# A batch made of bare IDs and separators only - the common CLI format -
+# can be parsed with one findall pass instead of a split + per-item loop
+_PURE_ID_BATCH = re.compile(r"[0-9,\s]+")
+_ID_RUN = re.compile(r"\d+")
 
 
 def extract_product_id_from_url(url: str) -> Optional[str]:
@@ -58,19 +86,14 @@ def extract_product_id_from_url(url: str) -> Optional[str]:
     if url.isdigit():
         return url
 
-    # Try to extract from URL
-    patterns = [
-        r"/item/(\d+)\.html",  # Standard format
-        r"/item/(\d+)",  # Without .html
-        r"item/(\d+)",  # Without leading slash
-        r"/(\d+)\.html",  # Just ID with .html
-        r"(\d{13,})",  # Long product ID pattern (13+ digits)
-    ]
+    # Explicit URL shapes first; bare digit runs only as a last resort
+    match = _ID_RE.search(url)
+    if match:
+        return match.group(1) or match.group(2)
 
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
+    match = _ID_FALLBACK_RE.search(url)
+    if match:
+        return match.group(1)
 
     return None
 
@@ -85,13 +108,21 @@ def parse_batch_products(batch_string: str) -> List[str]:
     - "id1\nid2\nid3"
     - "url1,url2,url3"
     """
+    # Fast path: pure-ID batches resolve in a single regex pass
+    if _PURE_ID_BATCH.fullmatch(batch_string):
+        return _ID_RUN.findall(batch_string)
+
     # Split by comma or newline
-    items = re.split(r"[,\n]", batch_string)
+    items = _BATCH_SPLIT.split(batch_string)
 
     product_ids: List[str] = []
     for item in items:
         item = item.strip()
         if item:
+            # Pure-ID batches (the common case) skip the regex entirely
+            if item.isdigit():
+                product_ids.append(item)
+                continue
             product_id = extract_product_id_from_url(item)
             if product_id:
                 product_ids.append(product_id)
@@ -101,29 +132,49 @@ def parse_batch_products(batch_string: str) -> List[str]:
     return product_ids
 
 
+class _LineWriter:
+    """Append-style adapter that writes newline-terminated lines to a buffer."""
+
+    __slots__ = ("_write",)
+
+    def __init__(self, buf: io.StringIO):
+        self._write = buf.write
+
+    def append(self, line: str) -> None:
+        self._write(line)
+        self._write("\n")
+
+
 def format_output_text(product_data: Dict[str, Any], verbose: bool = False) -> str:
     """Format product data as human-readable text."""
     if not product_data.get("success"):
         return f"❌ Error: {product_data.get('error', 'Unknown error')}"
 
-    output: List[str] = []
+    # Single contiguous buffer instead of a list of fragments plus a join;
+    # bind each section once up front instead of re-hashing the same keys
+    get = product_data.get
+    price = get("price")
+    rating = get("rating")
+    store = get("store")
+    shipping = get("shipping")
+    sku_options = get("sku_options")
+
+    buf = io.StringIO()
+    output = _LineWriter(buf)
     output.append("🎯 PRODUCT INFORMATION")
     output.append("=" * 50)
     output.append(f"📝 Title: {product_data['title']}")
     output.append(f"🆔 Product ID: {product_data['product_id']}")
 
-    if product_data.get("price"):
-        price = product_data["price"]
+    if price:
         output.append(
             f"💰 Price: {price['sale_price']} (was {price['original_price']} {price['currency']})"
         )
 
-    if product_data.get("rating"):
-        rating = product_data["rating"]
+    if rating:
         output.append(f"⭐ Rating: {rating['score']} stars ({rating['total_sold']})")
 
-    if product_data.get("store"):
-        store = product_data["store"]
+    if store:
         output.append(
             f"🏪 Store: {store['name']} ({store['rating']}/100, {store['positive_rate']} positive)"
         )
@@ -131,8 +182,7 @@ def format_output_text(product_data: Dict[str, Any], verbose: bool = False) -> s
             output.append(f"    Country: {store['country']}")
             output.append(f"    Open since: {store['open_time']}")
 
-    if product_data.get("shipping"):
-        shipping = product_data["shipping"]
+    if shipping:
         output.append(
             f"🚚 Shipping: {shipping['delivery_days_min']}-{shipping['delivery_days_max']} days"
         )
@@ -140,40 +190,42 @@ def format_output_text(product_data: Dict[str, Any], verbose: bool = False) -> s
             f"    Cost: {shipping['shipping_cost']} from {shipping['ship_from']} via {shipping['carrier']}"
         )
 
-    if product_data.get("sku_options") and verbose:
+    if sku_options and verbose:
         output.append(f"🎨 Available Options:")
-        for option in product_data["sku_options"]:
+        for option in sku_options:
             values = ", ".join(option["values"][:5])
             if len(option["values"]) > 5:
                 values += f" (+ {len(option['values']) - 5} more)"
             output.append(f"    {option['name']}: {values}")
 
-    output.append(f"🖼️ Images: {len(product_data.get('images', []))} available")
+    output.append(f"🖼️ Images: {len(get('images') or ())} available")
 
     if verbose:
         output.append(
-            f"📊 Data sections available: {len(product_data.get('available_sections', []))}"
+            f"📊 Data sections available: {len(get('available_sections') or ())}"
         )
-        output.append(f"🔍 API Trace ID: {product_data.get('api_trace_id', 'N/A')}")
+        output.append(f"🔍 API Trace ID: {get('api_trace_id', 'N/A')}")
 
         # Show automation info
-        if product_data.get("automation_used"):
+        if get("automation_used"):
             output.append("🤖 Automation info:")
             output.append(f"    Used automated cookies: Yes")
             output.append(
-                f"    Cookies from cache: {product_data.get('cookies_from_cache', 'N/A')}"
+                f"    Cookies from cache: {get('cookies_from_cache', 'N/A')}"
             )
-            if product_data.get("retry_attempted"):
+            if get("retry_attempted"):
                 output.append("    Retry with fresh cookies: Yes")
 
-    return "\n".join(output)
+    return buf.getvalue()[:-1]  # drop the trailing newline
 
 
 def format_batch_output_text(
     batch_results: Dict[str, Any], verbose: bool = False
 ) -> str:
     """Format batch processing results as human-readable text."""
-    output: List[str] = []
+    # Single contiguous buffer instead of a list of fragments plus a join
+    buf = io.StringIO()
+    output = _LineWriter(buf)
 
     # Summary
     output.append("📊 BATCH PROCESSING RESULTS")
@@ -194,29 +246,37 @@ def format_batch_output_text(
     if batch_results["products"]:
         output.append("✅ SUCCESSFUL PRODUCTS:")
         output.append("-" * 25)
+        # Hoist the bound method so the loop body does LOAD_FAST instead of
+        # a per-iteration attribute lookup; skip the empty-dict fallback
+        # allocation that .get("price", {}) would pay on every miss
+        append = output.append
         for product_id, product_data in batch_results["products"].items():
             title = product_data.get("title", "N/A")[:50]
-            price = product_data.get("price", {}).get("sale_price", "N/A")
-            output.append(f"🎯 {product_id}: {title}... | Price: {price}")
+            price_dict = product_data.get("price")
+            price = price_dict.get("sale_price", "N/A") if price_dict else "N/A"
+            append(f"🎯 {product_id}: {title}... | Price: {price}")
 
     # Failed products
     if batch_results["failed"]:
         output.append("")
         output.append("❌ FAILED PRODUCTS:")
         output.append("-" * 18)
+        append = output.append
         for product_id, error_data in batch_results["failed"].items():
             error = error_data.get("error", "Unknown error")[:60]
-            output.append(f"💥 {product_id}: {error}...")
+            append(f"💥 {product_id}: {error}...")
 
-    return "\n".join(output)
+    return buf.getvalue()[:-1]  # drop the trailing newline
 
 
 def format_output_json(data: Dict[str, Any], pretty: bool = True) -> str:
     """Format data as JSON."""
+    if orjson_available:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        return orjson.dumps(data, option=option).decode()
     if pretty:
         return json.dumps(data, indent=2, ensure_ascii=False)
-    else:
-        return json.dumps(data, ensure_ascii=False)
+    return json.dumps(data, ensure_ascii=False)
 
 
 def format_seller_data_for_csv(
@@ -317,7 +377,7 @@ def format_seller_data_for_csv(
 
 def extract_seller_info_for_csv(
     product_input: str,
-    client: EnhancedAliExpressClient,
+    client: "EnhancedAliExpressClient",
     manual_cookie: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
@@ -441,7 +501,7 @@ def output_seller_csv(csv_data: Dict[str, Any], output_format: str = "csv") -> s
 
 
 def handle_test_automation(
-    client: EnhancedAliExpressClient, verbose: bool = False
+    client: "EnhancedAliExpressClient", verbose: bool = False
 ) -> None:
     """Handle the automation testing command."""
     print("🧪 Testing Enhanced AliExpress Client Automation")
@@ -452,7 +512,15 @@ def handle_test_automation(
 
     if verbose or not test_results["overall_success"]:
         print("📋 Detailed Test Results:")
-        print(json.dumps(test_results, indent=2))
+        if orjson_available:
+            # Bytes go straight to the FD without a second encode pass
+            sys.stdout.flush()
+            sys.stdout.buffer.write(
+                orjson.dumps(test_results, option=orjson.OPT_INDENT_2)
+            )
+            sys.stdout.buffer.write(b"\n")
+        else:
+            print(json.dumps(test_results, indent=2))
 
     if test_results["overall_success"]:
         print("🎉 All automation tests passed! System is ready for use.")
@@ -558,6 +626,11 @@ Manual cookie format example:
         "-v", "--verbose", action="store_true", help="Show detailed information"
     )
     parser.add_argument("--raw", action="store_true", help="Output raw API response")
+    parser.add_argument(
+        "--ndjson",
+        action="store_true",
+        help="Batch mode: stream one JSON record per line as results complete",
+    )
 
     # Seller extraction options
     parser.add_argument(
@@ -591,23 +664,48 @@ Manual cookie format example:
         "--batch-delay",
         type=float,
         default=1.0,
-        help="Delay between batch requests in seconds (default: 1.0)",
+        help="Upper bound of random per-request jitter in batch mode (default: 1.0)",
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=10,
+        help="Maximum concurrent requests in batch mode (default: 10)",
     )
     parser.add_argument(
         "--no-proxy",
         action="store_true",
         help="Disable Oxylabs proxy usage",
     )
+    parser.add_argument(
+        "--browser-endpoint",
+        help="CDP WebSocket endpoint of a running Chromium to reuse "
+        "(e.g. from 'chromium --remote-debugging-port'); skips browser launch",
+    )
+    parser.add_argument(
+        "--full-browser",
+        action="store_true",
+        help="Load all page resources during cookie generation "
+        "(images/fonts/media are blocked by default for speed)",
+    )
 
     # Parse arguments
     args = parser.parse_args()
 
+    # Deferred import: --help and argument errors never pay for the
+    # client module (requests, crypto, generator machinery)
+    from aliexpress_store_scraper.clients.enhanced_aliexpress_client import (
+        EnhancedAliExpressClient,
+    )
+
     # Initialize enhanced client
     client = EnhancedAliExpressClient(
         cookie_cache_minutes=args.cache_minutes,
         auto_retry=True,
         headless_browser=not args.no_headless,
         use_proxy=not args.no_proxy,
+        browser_cdp_endpoint=args.browser_endpoint,
+        minimal_browser=not args.full_browser,
     )
 
     # Handle test automation
@@ -672,20 +770,45 @@ Manual cookie format example:
             print(file=sys.stderr)
 
         try:
+            # Streaming mode: emit each record as its request finishes, so
+            # peak memory stays flat and the first result appears at once
+            if args.ndjson:
+                write = sys.stdout.write
+                failed_count = 0
+                for record in client.iter_batch_products(
+                    product_ids,
+                    delay_seconds=args.batch_delay,
+                    manual_cookies=args.cookie_string,
+                    max_workers=args.max_concurrency,
+                ):
+                    if not record.get("success"):
+                        failed_count += 1
+                    write(format_output_json(record, pretty=False))
+                    write("\n")
+                    sys.stdout.flush()
+                sys.exit(failed_count != 0)
+
             batch_results = client.batch_get_products(
                 product_ids,
                 delay_seconds=args.batch_delay,
                 manual_cookies=args.cookie_string,
+                max_workers=args.max_concurrency,
             )
 
-            # Output results
+            # Output results; plain --json skips the indent pass entirely
             if args.raw or args.json or args.pretty_json:
-                print(format_output_json(batch_results, pretty=True))
+                pretty = args.pretty_json or args.raw
+                print(format_output_json(batch_results, pretty=pretty))
             else:
-                print(format_batch_output_text(batch_results, verbose=args.verbose))
+                # Write the buffer straight out: skips the full-size copy a
+                # trailing-newline strip plus print() would make
+                sys.stdout.write(
+                    format_batch_output_text(batch_results, verbose=args.verbose)
+                )
+                sys.stdout.write("\n")
 
             # Exit with appropriate code
-            sys.exit(0 if batch_results["success"] else 1)
+            sys.exit(not batch_results["success"])
 
         except Exception as e:
             print(f"❌ Batch processing error: {e}", file=sys.stderr)
@@ -765,17 +888,17 @@ Manual cookie format example:
         # Get product data with enhanced client
         if args.force_fresh_cookies and not args.cookie_string:
             # Force fresh cookies by clearing cache first
-            client.cookie_generator.clear_cache()
+            client.clear_cookie_cache()
 
         product_data = client.get_product(product_id, args.cookie_string)
 
-        # Output results
-        if args.raw:
-            print(format_output_json(product_data, pretty=True))
-        elif args.json or args.pretty_json:
-            print(format_output_json(product_data, pretty=True))
+        # Output results; plain --json skips the indent pass entirely
+        if args.raw or args.json or args.pretty_json:
+            pretty = args.pretty_json or args.raw
+            print(format_output_json(product_data, pretty=pretty))
         else:
-            print(format_output_text(product_data, verbose=args.verbose))
+            sys.stdout.write(format_output_text(product_data, verbose=args.verbose))
+            sys.stdout.write("\n")
 
         # Show automation status in verbose mode
         if (
@@ -27,6 +27,14 @@ from urllib.parse import urlencode
 import requests
 from dotenv import load_dotenv
 
+# Use orjson for response parsing if available (C-level, much faster)
+try:
+    import orjson
+
+    orjson_available = True
+except ImportError:
+    orjson_available = False
+
 # Load environment variables
 load_dotenv()
 
@@ -49,8 +57,19 @@ class AliExpressClient:
             base_url: Base URL for API requests (default: https://acs.aliexpress.us)
             use_proxy: Whether to use Oxylabs proxy configuration from environment
         """
+        # Pooled keep-alive session: the TLS handshake to the API host is
+        # paid once per pooled connection, not once per request. The pool is
+        # sized for concurrent batch workers hitting the same host.
         self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=10, pool_maxsize=32)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.base_url = base_url.rstrip("/")
+
+        # Memoized (cookie_string, auth_data) of the last token extraction;
+        # batch runs reuse one cookie string across every request
+        self._token_memo: Optional[tuple[str, Dict[str, Optional[str]]]] = None
+
         self.user_agent = (
             "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
             "(KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
@@ -60,6 +79,16 @@ class AliExpressClient:
         if use_proxy:
             self._configure_oxylabs_proxy()
 
+    def close(self) -> None:
+        """Release the pooled HTTP connections."""
+        self.session.close()
+
+    def __enter__(self) -> "AliExpressClient":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
     def _configure_oxylabs_proxy(self):
         """Configure Oxylabs residential proxy from environment variables"""
         username = os.getenv("OXYLABS_USERNAME")
@@ -95,6 +124,10 @@ class AliExpressClient:
         Raises:
             ValueError: If _m_h5_tk cookie is missing
         """
+        memo = self._token_memo
+        if memo is not None and memo[0] == cookie_string:
+            return memo[1]
+
         cookies: Dict[str, str] = {}
         for cookie in cookie_string.split("; "):
             if "=" in cookie:
@@ -111,7 +144,9 @@ class AliExpressClient:
             token = h5_token
             cookie_timestamp = None
 
-        return {"token": token, "cookie_timestamp": cookie_timestamp}
+        auth_data = {"token": token, "cookie_timestamp": cookie_timestamp}
+        self._token_memo = (cookie_string, auth_data)
+        return auth_data
 
     def generate_signature(
         self, token: str, timestamp: str, app_key: str, data: str
@@ -172,8 +207,10 @@ class AliExpressClient:
         if match:
             json_str = match.group(1)
             try:
+                if orjson_available:
+                    return orjson.loads(json_str)
                 return json.loads(json_str)
-            except json.JSONDecodeError:
+            except ValueError:
                 return None
         return None
 
@@ -294,13 +331,17 @@ class AliExpressClient:
                 "timestamp": None,
             }
 
-    def get_product(self, product_id: str, cookie_string: str) -> Dict[str, Any]:
+    def get_product(
+        self, product_id: str, cookie_string: str, return_raw: bool = False
+    ) -> Dict[str, Any]:
         """
         Get detailed product information by product ID.
 
         Args:
             product_id: AliExpress product ID (e.g., "3256809096800275")
             cookie_string: Raw cookie string from browser with _m_h5_tk token
+            return_raw: Also attach the raw API response as "_raw_api" so
+                callers needing it avoid a second identical API call
 
         Returns:
             Dictionary with extracted product information
@@ -348,7 +389,10 @@ class AliExpressClient:
         api_data = result["data"]
         product_data = api_data.get("data", {}).get("result", {})
 
-        return self._extract_product_details(product_data, product_id, api_data)
+        product_info = self._extract_product_details(product_data, product_id, api_data)
+        if return_raw:
+            product_info["_raw_api"] = result
+        return product_info
 
     def _extract_product_details(
         self, product_data: Dict[str, Any], product_id: str, api_data: Dict[str, Any]
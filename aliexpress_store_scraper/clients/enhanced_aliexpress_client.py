@@ -23,12 +23,17 @@ Author: Enhanced version with automation features
 Date: August 2025
 """
 
+import logging
+import random
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any, Dict, Optional
 
 from aliexpress_store_scraper.clients.aliexpress_client import AliExpressClient
-from aliexpress_store_scraper.utils.async_cookie_generator import AsyncCookieGenerator
-from aliexpress_store_scraper.utils.cookie_generator import CookieGenerator
+
+# Module logger; lazy %-formatting keeps hot paths free when disabled
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
 
 
 class EnhancedAliExpressClient(AliExpressClient):
@@ -46,6 +51,8 @@ class EnhancedAliExpressClient(AliExpressClient):
         auto_retry: bool = True,
         headless_browser: bool = True,
         use_proxy: bool = True,
+        browser_cdp_endpoint: Optional[str] = None,
+        minimal_browser: bool = True,
     ):
         """
         Initialize the enhanced AliExpress client.
@@ -56,9 +63,21 @@ class EnhancedAliExpressClient(AliExpressClient):
             auto_retry: Whether to retry with fresh cookies on failure
             headless_browser: Whether to run browser in headless mode
             use_proxy: Whether to use Oxylabs proxy configuration from environment
+            browser_cdp_endpoint: WebSocket endpoint of an already-running
+                Chromium to reuse across invocations (skips browser launch)
+            minimal_browser: Block image/font/media/stylesheet loads during
+                cookie generation so refreshes skip most page weight
         """
         super().__init__(base_url, use_proxy=use_proxy)
 
+        # Deferred so importing this module stays cheap for callers that
+        # never touch automation; the Playwright-backed generators pull in
+        # the browser driver machinery
+        from aliexpress_store_scraper.utils.async_cookie_generator import (
+            AsyncCookieGenerator,
+        )
+        from aliexpress_store_scraper.utils.cookie_generator import CookieGenerator
+
         self.auto_retry = auto_retry
 
         # Set up proxy configuration for async cookie generator
@@ -74,6 +93,8 @@ class EnhancedAliExpressClient(AliExpressClient):
             cache_validity_minutes=cookie_cache_minutes,
             headless=headless_browser,
             base_url="https://www.aliexpress.us",
+            cdp_endpoint=browser_cdp_endpoint,
+            block_resources=minimal_browser,
         )
 
         # Also set up async version for when running in async context
@@ -88,6 +109,10 @@ class EnhancedAliExpressClient(AliExpressClient):
         self._last_successful_cookies: Optional[str] = None
         self._last_cookie_time: float = 0
 
+        # Cached automation status, invalidated whenever cookie state moves
+        self._status_cache: Optional[Dict[str, Any]] = None
+        self._status_dirty = True
+
     def _get_valid_cookies(self, force_refresh: bool = False) -> Dict[str, Any]:
         """
         Get valid cookies for making API requests.
@@ -99,11 +124,21 @@ class EnhancedAliExpressClient(AliExpressClient):
             Dictionary with cookies and metadata
         """
         try:
-            result = self.cookie_generator.get_valid_cookies(
-                force_refresh=force_refresh
-            )
+            # Any fetch may rewrite the cache file or cookie state, so the
+            # status snapshot is stale whether or not this attempt succeeds
+            self._status_dirty = True
+
+            # Bounded retry instead of recursing with force_refresh=True:
+            # first pass honors the cache, second forces fresh cookies
+            attempts = (True,) if force_refresh else (False, True)
+            result: Dict[str, Any] = {}
+
+            for force in attempts:
+                result = self.cookie_generator.get_valid_cookies(force_refresh=force)
+
+                if not (result["success"] and result.get("cookies")):
+                    return result
 
-            if result["success"] and result.get("cookies"):
                 # Validate cookies have essential tokens
                 validation = self.cookie_generator.validate_cookies(result["cookies"])
 
@@ -111,13 +146,11 @@ class EnhancedAliExpressClient(AliExpressClient):
                     self._last_successful_cookies = result["cookies"]
                     self._last_cookie_time = time.time()
                     return result
-                else:
-                    print(
-                        f"⚠️ Generated cookies missing essential tokens: {validation['missing_essential']}"
-                    )
-                    if not force_refresh:
-                        # Try once more with force refresh
-                        return self._get_valid_cookies(force_refresh=True)
+
+                log.warning(
+                    "⚠️ Generated cookies missing essential tokens: %s",
+                    validation["missing_essential"],
+                )
 
             return result
 
@@ -128,8 +161,23 @@ class EnhancedAliExpressClient(AliExpressClient):
                 "cookies": "",
             }
 
+    def clear_cookie_cache(self) -> bool:
+        """
+        Clear the cookie generator's session cache and invalidate the
+        automation status snapshot along with it.
+
+        Returns:
+            True if the cache file was removed
+        """
+        cleared = self.cookie_generator.clear_cache()
+        self._status_dirty = True
+        return cleared
+
     def get_product_with_auto_cookies(
-        self, product_id: str, manual_cookies: Optional[str] = None
+        self,
+        product_id: str,
+        manual_cookies: Optional[str] = None,
+        return_raw: bool = False,
     ) -> Dict[str, Any]:
         """
         Get product data with automatic cookie management.
@@ -137,14 +185,16 @@ class EnhancedAliExpressClient(AliExpressClient):
         Args:
             product_id: AliExpress product ID
             manual_cookies: Optional manual cookies (bypasses automation)
+            return_raw: Also attach the raw API response as "_raw_api" so
+                callers needing it avoid a second identical API call
 
         Returns:
             Dictionary with product information or error details
         """
         # Use manual cookies if provided
         if manual_cookies:
-            print("🔧 Using manually provided cookies")
-            return self.get_product(product_id, manual_cookies)
+            log.info("🔧 Using manually provided cookies")
+            return self.get_product(product_id, manual_cookies, return_raw=return_raw)
 
         # Try with existing cached cookies first
         cookie_result = self._get_valid_cookies(force_refresh=False)
@@ -160,20 +210,24 @@ class EnhancedAliExpressClient(AliExpressClient):
         cookies = cookie_result["cookies"]
         from_cache = cookie_result.get("from_cache", False)
 
-        print(
-            f"🍪 Using {'cached' if from_cache else 'fresh'} cookies for product {product_id}"
+        log.info(
+            "🍪 Using %s cookies for product %s",
+            "cached" if from_cache else "fresh",
+            product_id,
         )
 
         # Try to get product data
-        result = self.get_product(product_id, cookies)
+        result = self.get_product(product_id, cookies, return_raw=return_raw)
 
         # If failed and auto_retry is enabled, try with fresh cookies
         if not result["success"] and self.auto_retry and from_cache:
-            print("🔄 Cached cookies failed, retrying with fresh cookies...")
+            log.info("🔄 Cached cookies failed, retrying with fresh cookies...")
 
             fresh_cookie_result = self._get_valid_cookies(force_refresh=True)
             if fresh_cookie_result["success"]:
-                result = self.get_product(product_id, fresh_cookie_result["cookies"])
+                result = self.get_product(
+                    product_id, fresh_cookie_result["cookies"], return_raw=return_raw
+                )
                 result["retry_attempted"] = True
             else:
                 result["cookie_refresh_error"] = fresh_cookie_result.get("error")
@@ -185,7 +239,10 @@ class EnhancedAliExpressClient(AliExpressClient):
         return result
 
     def get_product(
-        self, product_id: str, cookie_string: Optional[str] = None
+        self,
+        product_id: str,
+        cookie_string: Optional[str] = None,
+        return_raw: bool = False,
     ) -> Dict[str, Any]:
         """
         Get product data. If no cookies provided, uses automated cookie generation.
@@ -193,30 +250,67 @@ class EnhancedAliExpressClient(AliExpressClient):
         Args:
             product_id: AliExpress product ID
             cookie_string: Optional cookie string (if not provided, will be auto-generated)
+            return_raw: Also attach the raw API response as "_raw_api"
 
         Returns:
             Dictionary with product information
         """
         if cookie_string:
             # Use the original method with provided cookies
-            return super().get_product(product_id, cookie_string)
+            return super().get_product(product_id, cookie_string, return_raw=return_raw)
         else:
             # Use automated cookie management
-            return self.get_product_with_auto_cookies(product_id)
+            return self.get_product_with_auto_cookies(product_id, return_raw=return_raw)
+
+    def _fetch_one_product(
+        self, product_id: str, cookies: str, jitter_seconds: float
+    ) -> Dict[str, Any]:
+        """
+        Fetch a single product for a batch worker.
+
+        Args:
+            product_id: AliExpress product ID
+            cookies: Shared cookie string for the batch
+            jitter_seconds: Upper bound for a random pre-request sleep that
+                spreads concurrent requests out for rate control
+
+        Returns:
+            Product result dictionary (success or error form)
+        """
+        try:
+            if jitter_seconds > 0:
+                time.sleep(random.uniform(0, jitter_seconds))
+            # Use direct method to avoid double automation
+            return super(EnhancedAliExpressClient, self).get_product(
+                product_id, cookies
+            )
+        except Exception as e:
+            return {
+                "success": False,
+                "error": str(e),
+                "product_id": product_id,
+            }
 
     def batch_get_products(
         self,
         product_ids: list[str],
         delay_seconds: float = 1.0,
         manual_cookies: Optional[str] = None,
+        max_workers: int = 10,
     ) -> Dict[str, Any]:
         """
-        Get multiple products with shared cookie session.
+        Get multiple products concurrently with a shared cookie session.
+
+        Requests fan out over a bounded worker pool instead of running
+        serially, so batch wall-clock is roughly ceil(N / max_workers)
+        round-trips rather than N * (round-trip + delay).
 
         Args:
             product_ids: List of product IDs to fetch
-            delay_seconds: Delay between requests to avoid rate limiting
+            delay_seconds: Upper bound of the random per-request jitter used
+                to spread out concurrent requests (rate control)
             manual_cookies: Optional manual cookies for all requests
+            max_workers: Maximum number of concurrent requests
 
         Returns:
             Dictionary with results for each product ID
@@ -241,46 +335,116 @@ class EnhancedAliExpressClient(AliExpressClient):
                 )
                 return results
             cookies = cookie_result["cookies"]
-            print(f"🍪 Using shared cookie session for {len(product_ids)} products")
+            log.info(
+                "🍪 Using shared cookie session for %d products", len(product_ids)
+            )
         else:
             cookies = manual_cookies
-            print(f"🔧 Using manual cookies for {len(product_ids)} products")
+            log.info("🔧 Using manual cookies for %d products", len(product_ids))
+
+        # Fan requests out over a bounded pool; the shared requests.Session
+        # keeps its per-host connection pool warm across workers. Per-item
+        # log lines are buffered and emitted once, and only built at all
+        # when INFO is enabled, so logging costs nothing in quiet batches;
+        # dict lookups are bound to locals in the tight loop.
+        total = len(product_ids)
+        products = results["products"]
+        failed = results["failed"]
+        successful = 0
+        failed_count = 0
+        log_enabled = log.isEnabledFor(logging.INFO)
+        log_lines: list[str] = []
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_to_id = {
+                executor.submit(
+                    self._fetch_one_product, product_id, cookies, delay_seconds
+                ): product_id
+                for product_id in product_ids
+            }
 
-        # Process each product
-        for i, product_id in enumerate(product_ids):
-            print(f"📦 [{i + 1}/{len(product_ids)}] Fetching product {product_id}...")
+            for i, future in enumerate(as_completed(future_to_id)):
+                product_id = future_to_id[future]
+                result = future.result()
+                ok = result["success"]
 
-            try:
-                # Use direct method to avoid double automation
-                result = super().get_product(product_id, cookies)
+                if log_enabled:
+                    log_lines.append(
+                        f"📦 [{i + 1}/{total}] Finished product {product_id}"
+                    )
+                    if ok:
+                        log_lines.append(
+                            f"✅ Success: {result.get('title', 'N/A')[:50]}..."
+                        )
+                    else:
+                        log_lines.append(
+                            f"❌ Failed: {result.get('error', 'Unknown error')}"
+                        )
 
-                if result["success"]:
-                    results["products"][product_id] = result
-                    results["successful"] += 1
-                    print(f"✅ Success: {result.get('title', 'N/A')[:50]}...")
+                if ok:
+                    products[product_id] = result
+                    successful += 1
                 else:
-                    results["failed"][product_id] = result
-                    results["failed_count"] += 1
-                    print(f"❌ Failed: {result.get('error', 'Unknown error')}")
+                    failed[product_id] = result
+                    failed_count += 1
 
-                # Delay between requests
-                if i < len(product_ids) - 1 and delay_seconds > 0:
-                    time.sleep(delay_seconds)
+        if log_lines:
+            log.info("%s", "\n".join(log_lines))
 
-            except Exception as e:
-                error_result: Dict[str, Any] = {
+        # Update overall success status
+        results["successful"] = successful
+        results["failed_count"] = failed_count
+        results["success"] = failed_count == 0
+
+        return results
+
+    def iter_batch_products(
+        self,
+        product_ids: list[str],
+        delay_seconds: float = 1.0,
+        manual_cookies: Optional[str] = None,
+        max_workers: int = 10,
+    ):
+        """
+        Yield product results as they complete instead of buffering a batch.
+
+        Streaming keeps peak memory flat for very large batches and lets
+        callers emit each record the moment its request finishes.
+
+        Args:
+            product_ids: List of product IDs to fetch
+            delay_seconds: Upper bound of the random per-request jitter
+            manual_cookies: Optional manual cookies for all requests
+            max_workers: Maximum number of concurrent requests
+
+        Yields:
+            Product result dictionaries (success or error form), each
+            carrying its "product_id"
+        """
+        if not manual_cookies:
+            cookie_result = self._get_valid_cookies(force_refresh=False)
+            if not cookie_result["success"]:
+                yield {
                     "success": False,
-                    "error": str(e),
-                    "product_id": product_id,
+                    "error": f"Failed to get cookies: {cookie_result.get('error')}",
                 }
-                results["failed"][product_id] = error_result
-                results["failed_count"] += 1
-                print(f"❌ Exception for {product_id}: {e}")
+                return
+            cookies = cookie_result["cookies"]
+        else:
+            cookies = manual_cookies
 
-        # Update overall success status
-        results["success"] = results["failed_count"] == 0
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_to_id = {
+                executor.submit(
+                    self._fetch_one_product, product_id, cookies, delay_seconds
+                ): product_id
+                for product_id in product_ids
+            }
 
-        return results
+            for future in as_completed(future_to_id):
+                result = future.result()
+                result.setdefault("product_id", future_to_id[future])
+                yield result
 
     def test_automation(self) -> Dict[str, Any]:
         """
@@ -402,6 +566,11 @@ class EnhancedAliExpressClient(AliExpressClient):
         Returns:
             Status information about cookies and automation
         """
+        # Serve the cached snapshot unless cookie state changed since the
+        # last computation; recomputing probes the cache file every time
+        if not self._status_dirty and self._status_cache is not None:
+            return self._status_cache
+
         status: Dict[str, Any] = {
             "timestamp": time.time(),
             "cache_file_exists": self.cookie_generator.cache_file.exists(),
@@ -427,6 +596,8 @@ class EnhancedAliExpressClient(AliExpressClient):
         else:
             status["cache_valid"] = False
 
+        self._status_cache = status
+        self._status_dirty = False
         return status
 
     async def _get_valid_cookies_async(
@@ -453,6 +624,7 @@ class EnhancedAliExpressClient(AliExpressClient):
                 if validation["valid"]:
                     self._last_successful_cookies = result["cookies"]
                     self._last_cookie_time = time.time()
+                    self._status_dirty = True
                     return result
                 else:
                     print(
@@ -549,6 +721,20 @@ class EnhancedAliExpressClient(AliExpressClient):
 def main():
     """Example usage of the enhanced AliExpress client."""
 
+    import argparse
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    parser = argparse.ArgumentParser(
+        description="Enhanced AliExpress client with cookie automation"
+    )
+    parser.add_argument(
+        "--self-test",
+        action="store_true",
+        help="Run the automation self-test (launches a browser and hits the API)",
+    )
+    args = parser.parse_args()
+
     print("🚀 Enhanced AliExpress Client with Cookie Automation")
     print("=" * 55)
     print("Automated cookie generation: ✅ Ready")
@@ -563,6 +749,11 @@ def main():
         headless_browser=True,
     )
 
+    if not args.self_test:
+        print("💡 Client constructed. Run with --self-test to exercise the")
+        print("   full automation pipeline (browser launch + API call).")
+        return
+
     # Test automation system
     print("🧪 Running automation tests...")
     test_results = client.test_automation()
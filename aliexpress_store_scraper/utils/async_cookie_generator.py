@@ -23,7 +23,13 @@ import time
 from pathlib import Path
 from typing import Any, Dict, Optional
 
-from playwright.async_api import Browser, BrowserContext, Page, async_playwright
+from playwright.async_api import (
+    Browser,
+    BrowserContext,
+    Error as PlaywrightError,
+    Page,
+    async_playwright,
+)
 
 
 class AsyncCookieGenerator:
@@ -144,7 +150,9 @@ class AsyncCookieGenerator:
         except Exception as e:
             print(f"⚠️ Failed to save cache: {e}")
 
-    async def _extract_cookies_from_context(self, context: BrowserContext) -> str:
+    async def _extract_cookies_from_context(
+        self, context: BrowserContext
+    ) -> tuple[str, int]:
         """
         Extract cookies from browser context and format them as a cookie string.
 
@@ -152,15 +160,17 @@ class AsyncCookieGenerator:
             context: Playwright browser context
 
         Returns:
-            Formatted cookie string for HTTP headers
+            Tuple of (formatted cookie string for HTTP headers, cookie count)
         """
-        cookies = await context.cookies()
+        # Restrict the jar to the AliExpress origin - the context may have
+        # collected ads/CDN/tracker cookies we would only throw away
+        cookies = await context.cookies(urls=[self.base_url])
         cookie_pairs = []
 
         for cookie in cookies:
             cookie_pairs.append(f"{cookie['name']}={cookie['value']}")
 
-        return "; ".join(cookie_pairs)
+        return "; ".join(cookie_pairs), len(cookies)
 
     async def _setup_browser_context(self, browser: Browser) -> BrowserContext:
         """
@@ -241,7 +251,7 @@ class AsyncCookieGenerator:
                 if element:
                     print(f"🤖 Captcha challenge detected: {selector}")
                     return True
-            except:
+            except PlaywrightError:
                 continue
 
         return False
@@ -406,11 +416,12 @@ class AsyncCookieGenerator:
                             "⚠️ Could not solve bot challenge, proceeding with available cookies..."
                         )
 
-                # Extract cookies from context
-                cookie_string = await self._extract_cookies_from_context(context)
-                cookies_list = await context.cookies()
+                # Extract cookies from context (single jar fetch)
+                cookie_string, cookies_count = await self._extract_cookies_from_context(
+                    context
+                )
 
-                print(f"🍪 Collected {len(cookies_list)} cookies")
+                print(f"🍪 Collected {cookies_count} cookies")
 
                 # Prepare session data
                 session_data = {
@@ -438,6 +449,104 @@ class AsyncCookieGenerator:
             finally:
                 await browser.close()
 
+    async def _one_context(
+        self, browser: Browser, wait_time: int = 5
+    ) -> Dict[str, Any]:
+        """
+        Collect one independent cookie jar in its own browser context.
+
+        Contexts are lightweight isolated windows sharing the browser
+        process, so running several concurrently amortizes the single
+        Chromium launch over every session.
+
+        Args:
+            browser: Shared Playwright browser instance
+            wait_time: Time to wait on page for cookies to be set (seconds)
+
+        Returns:
+            Dictionary with cookies and session metadata
+        """
+        context = await self._setup_browser_context(browser)
+
+        try:
+            page = await context.new_page()
+            await page.goto(self.base_url, wait_until="networkidle", timeout=30000)
+            await asyncio.sleep(wait_time)
+
+            if await self._detect_captcha_challenge(page):
+                await self._solve_captcha_challenge(page)
+
+            cookie_string, cookies_count = await self._extract_cookies_from_context(
+                context
+            )
+
+            return {
+                "success": True,
+                "cookies": cookie_string,
+                "cookies_count": cookies_count,
+                "user_agent": self.user_agent,
+                "timestamp": time.time(),
+                "url": self.base_url,
+            }
+
+        except Exception as e:
+            return {
+                "success": False,
+                "cookies": "",
+                "error": str(e),
+                "timestamp": time.time(),
+            }
+
+        finally:
+            await context.close()
+
+    async def generate_batch(self, n: int, wait_time: int = 5) -> list[Dict[str, Any]]:
+        """
+        Generate N independent cookie jars concurrently on a single browser.
+
+        Useful for per-proxy or per-account scraping workloads that need
+        many separate sessions: one Chromium and one driver process serve
+        all N contexts instead of paying a full browser launch per session.
+
+        Args:
+            n: Number of independent sessions to generate
+            wait_time: Time to wait on each page for cookies to be set (seconds)
+
+        Returns:
+            List of session dictionaries, one per context
+        """
+        print(f"🚀 Starting browser to collect {n} cookie jars...")
+
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(
+                headless=self.headless, args=self.browser_args
+            )
+
+            try:
+                results = await asyncio.gather(
+                    *[self._one_context(browser, wait_time) for _ in range(n)]
+                )
+            finally:
+                await browser.close()
+
+        successes = sum(1 for result in results if result.get("success"))
+        print(f"🍪 Generated {successes}/{n} cookie jars")
+
+        return list(results)
+
+    def generate_batch_sync(self, n: int, wait_time: int = 5) -> list[Dict[str, Any]]:
+        """
+        Synchronous wrapper around :meth:`generate_batch`.
+
+        Args:
+            n: Number of independent sessions to generate
+            wait_time: Time to wait on each page for cookies to be set (seconds)
+
+        Returns:
+            List of session dictionaries, one per context
+        """
+        return asyncio.run(self.generate_batch(n, wait_time))
+
     def validate_cookies(self, cookies: str) -> Dict[str, Any]:
         """
         Validate that essential cookies are present in the cookie string.
@@ -52,21 +52,24 @@ class AdvancedCaptchaSolver:
                         }
                     }
                     
-                    // Check inside iframes
+                    // Check inside same-origin iframes only - cross-origin frames
+                    // throw SecurityError on contentDocument access every probe
                     const iframes = document.querySelectorAll('iframe');
                     for (const iframe of iframes) {
-                        try {
-                            const iframeDoc = iframe.contentDocument || iframe.contentWindow.document;
-                            for (const selector of captchaSelectors) {
-                                if (iframeDoc.querySelector(selector)) {
-                                    return true;
-                                }
+                        if (iframe.src && new URL(iframe.src, location.href).origin !== location.origin) {
+                            continue;
+                        }
+                        const iframeDoc = iframe.contentDocument;
+                        if (!iframeDoc) {
+                            continue;
+                        }
+                        for (const selector of captchaSelectors) {
+                            if (iframeDoc.querySelector(selector)) {
+                                return true;
                             }
-                        } catch (e) {
-                            // Ignore iframe access errors
                         }
                     }
-                    
+
                     return false;
                 }
             """)
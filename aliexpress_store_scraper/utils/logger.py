@@ -15,10 +15,56 @@ Usage:
     logger.error("Operation failed", f"Network error: {error}")
 """
 
+import atexit
 import logging
+from collections import OrderedDict
+import sys
+import threading
+import time
 from typing import Any, Callable, Optional
 
 
+def noop_callback(_message: str, _details: str = "") -> None:
+    """Shared do-nothing sink; pass as log_callback to silence a logger."""
+
+
+def _make_level_method(
+    prefix: str,
+    py_prefix: str,
+    level: int,
+    callback: Callable[[str], None],
+    py_log: Callable[..., None],
+    is_enabled: Callable[[int], bool],
+    callback_level: int,
+) -> tuple[Callable[..., None], Callable[..., None]]:
+    """
+    Build a pair of specialized level methods with everything constant baked
+    into the closures: no emoji lookup, no use_emojis branch, no attribute
+    dispatch. The second entry point takes details unconditionally so
+    callers that always pass both arguments skip the truthiness branch.
+    """
+    fmt = py_prefix + "%s"
+    below_threshold = level < callback_level
+
+    def log_method(title: str, details: str = "") -> None:
+        if below_threshold and not is_enabled(level):
+            return
+        # Build the title/details core once and share it between the
+        # callback and py_logger instead of interpolating twice
+        core = f"{title}: {details}" if details else title
+        callback(prefix + core)
+        py_log(fmt, core)
+
+    def log_method_detailed(title: str, details: str) -> None:
+        if below_threshold and not is_enabled(level):
+            return
+        core = f"{title}: {details}"
+        callback(prefix + core)
+        py_log(fmt, core)
+
+    return log_method, log_method_detailed
+
+
 class ScraperLogger:
     """
     Standardized logger for the AliExpress scraper with consistent formatting
@@ -46,12 +92,49 @@ class ScraperLogger:
         "skip": "⏭️ ",
         "wait": "⏳",
     }
+    # Interned copies so emoji-key lookups from call-site literals hash and
+    # compare by identity rather than recomputing string hashes
+    EMOJIS = {sys.intern(key): sys.intern(value) for key, value in EMOJIS.items()}
+
+    # Shared read-only prefix table; built once at class creation so each
+    # emoji logger's construction skips rebuilding 19 prefix strings
+    _PREFIX_TABLE = {key: sys.intern(value + " ") for key, value in EMOJIS.items()}
+
+    # Header separators, built once at class creation
+    _SECTION_SEP = "=" * 60
+    _SUB_SEP = "-" * 40
+
+    # (method name, emoji key, py_logger prefix, level, py_logger method)
+    _LEVEL_SPEC = (
+        ("info", "info", "", logging.INFO, "info"),
+        ("success", "success", "SUCCESS: ", logging.INFO, "info"),
+        ("error", "error", "", logging.ERROR, "error"),
+        ("warning", "warning", "", logging.WARNING, "warning"),
+        ("debug", "debug", "", logging.DEBUG, "debug"),
+        ("start", "start", "START: ", logging.INFO, "info"),
+        ("process", "process", "PROCESS: ", logging.INFO, "info"),
+        ("config", "config", "CONFIG: ", logging.INFO, "info"),
+        ("network", "network", "NETWORK: ", logging.INFO, "info"),
+        ("file_op", "file", "FILE: ", logging.INFO, "info"),
+        ("save", "save", "SAVE: ", logging.INFO, "info"),
+        ("load", "load", "LOAD: ", logging.INFO, "info"),
+        ("cache", "cache", "CACHE: ", logging.INFO, "info"),
+        ("retry", "retry", "RETRY: ", logging.INFO, "info"),
+        ("batch", "batch", "BATCH: ", logging.INFO, "info"),
+        ("progress", "progress", "PROGRESS: ", logging.INFO, "info"),
+        ("complete", "complete", "COMPLETE: ", logging.INFO, "info"),
+        ("skip", "skip", "SKIP: ", logging.INFO, "info"),
+        ("wait", "wait", "WAIT: ", logging.INFO, "info"),
+    )
 
     def __init__(
         self,
         module_name: str,
         log_callback: Optional[Callable[[str], None]] = None,
         use_emojis: bool = True,
+        min_callback_level: int = logging.INFO,
+        batch_size: int = 0,
+        batch_flush_ms: int = 100,
     ):
         """
         Initialize logger for a specific module
@@ -60,19 +143,118 @@ class ScraperLogger:
             module_name: Name of the module/component for prefixing
             log_callback: Optional callback function for custom logging
             use_emojis: Whether to include emojis in messages
+            min_callback_level: Messages below this level skip the callback
+                and all formatting unless the underlying logger wants them
+            batch_size: When > 0, buffer this many messages and emit them
+                with a single callback call (opt-in, for hot loops)
+            batch_flush_ms: Flush a non-empty buffer once it is older than
+                this many milliseconds, checked on each logged message
         """
         self.module_name = module_name
         self.log_callback = log_callback or self._default_print
         self.use_emojis = use_emojis
+        self._callback_level = min_callback_level
+
+        # Opt-in batching: wrap the real callback with a bounded buffer so
+        # high-frequency progress logging costs one write per batch_size
+        # messages instead of one per message
+        if batch_size > 0:
+            self._batch_size = batch_size
+            self._batch_flush_seconds = batch_flush_ms / 1000.0
+            self._batch: list[str] = []
+            self._batch_lock = threading.Lock()
+            self._batch_deadline = 0.0
+            self._sink = self.log_callback
+            self.log_callback = self._batch_append
+            atexit.register(self.flush)
+
+        # Prefixes are constant for the logger's lifetime; build them once
+        # and pick the matching formatter so no call re-checks use_emojis
+        if use_emojis:
+            self._prefix = self._PREFIX_TABLE
+            self._default_prefix = " "
+            self._format_message = self._format_with_emoji
+        else:
+            self._prefix = {}
+            self._default_prefix = ""
+            self._format_message = self._format_plain
 
         # Configure Python logger for debug output
         self.py_logger = logging.getLogger(f"aliexpress_scraper.{module_name}")
 
+        self._bind_level_methods()
+
+    def _bind_level_methods(self) -> None:
+        """
+        Shadow the class-level fallbacks with specialized closures; each
+        bakes in its prefix, format strings, and bound logging method so a
+        call is a threshold check plus two function calls
+        """
+        # Fully silenced loggers get the zero-allocation no-op on every
+        # level instead of paying for closures that discard their output
+        if self.log_callback is noop_callback and not self.py_logger.isEnabledFor(
+            logging.CRITICAL
+        ):
+            for name, *_rest in self._LEVEL_SPEC:
+                setattr(self, name, noop_callback)
+                setattr(self, name + "_d", noop_callback)
+            return
+
+        is_enabled = self.py_logger.isEnabledFor
+        callback = self.log_callback
+        for name, key, py_prefix, level, severity in self._LEVEL_SPEC:
+            method, method_detailed = _make_level_method(
+                self._prefix.get(key, self._default_prefix),
+                py_prefix,
+                level,
+                callback,
+                getattr(self.py_logger, severity),
+                is_enabled,
+                self._callback_level,
+            )
+            setattr(self, name, method)
+            # Branch-free variant for hot callers that always pass details
+            setattr(self, name + "_d", method_detailed)
+
+    def reconfigure(self) -> None:
+        """Re-derive the specialized fast paths after log levels change."""
+        self._bind_level_methods()
+
+    def _batch_append(self, message: str) -> None:
+        """Buffer a message, flushing on size or age thresholds."""
+        with self._batch_lock:
+            if not self._batch:
+                self._batch_deadline = time.monotonic() + self._batch_flush_seconds
+            self._batch.append(message)
+            if (
+                len(self._batch) < self._batch_size
+                and time.monotonic() < self._batch_deadline
+            ):
+                return
+            pending, self._batch = self._batch, []
+        self._sink("\n".join(pending))
+
+    def flush(self) -> None:
+        """Emit any buffered messages immediately (no-op when not batching)."""
+        if not getattr(self, "_batch", None):
+            return
+        with self._batch_lock:
+            pending, self._batch = self._batch, []
+        if pending:
+            self._sink("\n".join(pending))
+
     def _default_print(self, message: str) -> None:
         """Default print function"""
-        print(message)
+        # Single text-layer write with the newline attached: skips print()'s
+        # sep/end handling and its second write. sys.stdout is resolved per
+        # call so output redirection keeps working
+        sys.stdout.write(message + "\n")
 
-    def _format_message(self, emoji_key: str, title: str, details: str = "") -> str:
+    def _suppressed(self, level: int) -> bool:
+        """True when neither the callback nor py_logger wants this level."""
+        return level < self._callback_level and not self.py_logger.isEnabledFor(level)
+
+    def _format_with_emoji(self, emoji_key: str, title: str, details: str = "") -> str:
         """
         Format a message with consistent structure
 
@@ -84,192 +266,281 @@ class ScraperLogger:
         Returns:
             Formatted message string
         """
-        emoji = self.EMOJIS.get(emoji_key, "") if self.use_emojis else ""
+        prefix = self._prefix.get(emoji_key, " ")
 
         if details:
-            return f"{emoji} {title}: {details}"
-        else:
-            return f"{emoji} {title}"
+            return f"{prefix}{title}: {details}"
+        return f"{prefix}{title}"
+
+    def _format_plain(self, emoji_key: str, title: str, details: str = "") -> str:
+        """Emoji-free formatter selected at construction"""
+        if details:
+            return f"{title}: {details}"
+        return title
+
+    # Default for type checkers; replaced per instance in __init__
+    _format_message = _format_with_emoji
 
     def info(self, title: str, details: str = "") -> None:
         """Log informational message"""
+        if self._suppressed(logging.INFO):
+            return
         message = self._format_message("info", title, details)
         self.log_callback(message)
-        self.py_logger.info(f"{title}: {details}" if details else title)
+        if details:
+            self.py_logger.info("%s: %s", title, details)
+        else:
+            self.py_logger.info("%s", title)
 
     def success(self, title: str, details: str = "") -> None:
         """Log success message"""
+        if self._suppressed(logging.INFO):
+            return
         message = self._format_message("success", title, details)
         self.log_callback(message)
-        self.py_logger.info(
-            f"SUCCESS: {title}: {details}" if details else f"SUCCESS: {title}"
-        )
+        if details:
+            self.py_logger.info("SUCCESS: %s: %s", title, details)
+        else:
+            self.py_logger.info("SUCCESS: %s", title)
 
     def error(self, title: str, details: str = "") -> None:
         """Log error message"""
+        if self._suppressed(logging.ERROR):
+            return
         message = self._format_message("error", title, details)
         self.log_callback(message)
-        self.py_logger.error(f"{title}: {details}" if details else title)
+        if details:
+            self.py_logger.error("%s: %s", title, details)
+        else:
+            self.py_logger.error("%s", title)
 
     def warning(self, title: str, details: str = "") -> None:
         """Log warning message"""
+        if self._suppressed(logging.WARNING):
+            return
         message = self._format_message("warning", title, details)
         self.log_callback(message)
-        self.py_logger.warning(f"{title}: {details}" if details else title)
+        if details:
+            self.py_logger.warning("%s: %s", title, details)
+        else:
+            self.py_logger.warning("%s", title)
 
     def debug(self, title: str, details: str = "") -> None:
         """Log debug message"""
+        if self._suppressed(logging.DEBUG):
+            return
         message = self._format_message("debug", title, details)
         self.log_callback(message)
-        self.py_logger.debug(f"{title}: {details}" if details else title)
+        if details:
+            self.py_logger.debug("%s: %s", title, details)
+        else:
+            self.py_logger.debug("%s", title)
 
     def start(self, title: str, details: str = "") -> None:
         """Log process start message"""
+        if self._suppressed(logging.INFO):
+            return
         message = self._format_message("start", title, details)
         self.log_callback(message)
-        self.py_logger.info(
-            f"START: {title}: {details}" if details else f"START: {title}"
-        )
+        if details:
+            self.py_logger.info("START: %s: %s", title, details)
+        else:
+            self.py_logger.info("START: %s", title)
 
     def process(self, title: str, details: str = "") -> None:
         """Log process update message"""
+        if self._suppressed(logging.INFO):
+            return
         message = self._format_message("process", title, details)
         self.log_callback(message)
-        self.py_logger.info(
-            f"PROCESS: {title}: {details}" if details else f"PROCESS: {title}"
-        )
+        if details:
+            self.py_logger.info("PROCESS: %s: %s", title, details)
+        else:
+            self.py_logger.info("PROCESS: %s", title)
 
     def config(self, title: str, details: str = "") -> None:
         """Log configuration message"""
+        if self._suppressed(logging.INFO):
+            return
         message = self._format_message("config", title, details)
         self.log_callback(message)
-        self.py_logger.info(
-            f"CONFIG: {title}: {details}" if details else f"CONFIG: {title}"
-        )
+        if details:
+            self.py_logger.info("CONFIG: %s: %s", title, details)
+        else:
+            self.py_logger.info("CONFIG: %s", title)
 
     def network(self, title: str, details: str = "") -> None:
         """Log network-related message"""
+        if self._suppressed(logging.INFO):
+            return
         message = self._format_message("network", title, details)
         self.log_callback(message)
-        self.py_logger.info(
-            f"NETWORK: {title}: {details}" if details else f"NETWORK: {title}"
-        )
+        if details:
+            self.py_logger.info("NETWORK: %s: %s", title, details)
+        else:
+            self.py_logger.info("NETWORK: %s", title)
 
     def file_op(self, title: str, details: str = "") -> None:
         """Log file operation message"""
+        if self._suppressed(logging.INFO):
+            return
         message = self._format_message("file", title, details)
         self.log_callback(message)
-        self.py_logger.info(
-            f"FILE: {title}: {details}" if details else f"FILE: {title}"
-        )
+        if details:
+            self.py_logger.info("FILE: %s: %s", title, details)
+        else:
+            self.py_logger.info("FILE: %s", title)
 
     def save(self, title: str, details: str = "") -> None:
         """Log save operation message"""
+        if self._suppressed(logging.INFO):
+            return
         message = self._format_message("save", title, details)
         self.log_callback(message)
-        self.py_logger.info(
-            f"SAVE: {title}: {details}" if details else f"SAVE: {title}"
-        )
+        if details:
+            self.py_logger.info("SAVE: %s: %s", title, details)
+        else:
+            self.py_logger.info("SAVE: %s", title)
 
     def load(self, title: str, details: str = "") -> None:
         """Log load operation message"""
+        if self._suppressed(logging.INFO):
+            return
         message = self._format_message("load", title, details)
         self.log_callback(message)
-        self.py_logger.info(
-            f"LOAD: {title}: {details}" if details else f"LOAD: {title}"
-        )
+        if details:
+            self.py_logger.info("LOAD: %s: %s", title, details)
+        else:
+            self.py_logger.info("LOAD: %s", title)
 
     def cache(self, title: str, details: str = "") -> None:
         """Log cache-related message"""
+        if self._suppressed(logging.INFO):
+            return
         message = self._format_message("cache", title, details)
         self.log_callback(message)
-        self.py_logger.info(
-            f"CACHE: {title}: {details}" if details else f"CACHE: {title}"
-        )
+        if details:
+            self.py_logger.info("CACHE: %s: %s", title, details)
+        else:
+            self.py_logger.info("CACHE: %s", title)
 
     def retry(self, title: str, details: str = "") -> None:
         """Log retry operation message"""
+        if self._suppressed(logging.INFO):
+            return
         message = self._format_message("retry", title, details)
         self.log_callback(message)
-        self.py_logger.info(
-            f"RETRY: {title}: {details}" if details else f"RETRY: {title}"
-        )
+        if details:
+            self.py_logger.info("RETRY: %s: %s", title, details)
+        else:
+            self.py_logger.info("RETRY: %s", title)
 
     def batch(self, title: str, details: str = "") -> None:
         """Log batch processing message"""
+        if self._suppressed(logging.INFO):
+            return
         message = self._format_message("batch", title, details)
         self.log_callback(message)
-        self.py_logger.info(
-            f"BATCH: {title}: {details}" if details else f"BATCH: {title}"
-        )
+        if details:
+            self.py_logger.info("BATCH: %s: %s", title, details)
+        else:
+            self.py_logger.info("BATCH: %s", title)
 
     def progress(self, title: str, details: str = "") -> None:
         """Log progress message"""
+        if self._suppressed(logging.INFO):
+            return
         message = self._format_message("progress", title, details)
         self.log_callback(message)
-        self.py_logger.info(
-            f"PROGRESS: {title}: {details}" if details else f"PROGRESS: {title}"
-        )
+        if details:
+            self.py_logger.info("PROGRESS: %s: %s", title, details)
+        else:
+            self.py_logger.info("PROGRESS: %s", title)
 
     def complete(self, title: str, details: str = "") -> None:
         """Log completion message"""
+        if self._suppressed(logging.INFO):
+            return
         message = self._format_message("complete", title, details)
         self.log_callback(message)
-        self.py_logger.info(
-            f"COMPLETE: {title}: {details}" if details else f"COMPLETE: {title}"
-        )
+        if details:
+            self.py_logger.info("COMPLETE: %s: %s", title, details)
+        else:
+            self.py_logger.info("COMPLETE: %s", title)
 
     def skip(self, title: str, details: str = "") -> None:
         """Log skip message"""
+        if self._suppressed(logging.INFO):
+            return
         message = self._format_message("skip", title, details)
         self.log_callback(message)
-        self.py_logger.info(
-            f"SKIP: {title}: {details}" if details else f"SKIP: {title}"
-        )
+        if details:
+            self.py_logger.info("SKIP: %s: %s", title, details)
+        else:
+            self.py_logger.info("SKIP: %s", title)
 
     def wait(self, title: str, details: str = "") -> None:
         """Log wait message"""
+        if self._suppressed(logging.INFO):
+            return
         message = self._format_message("wait", title, details)
         self.log_callback(message)
-        self.py_logger.info(
-            f"WAIT: {title}: {details}" if details else f"WAIT: {title}"
-        )
+        if details:
+            self.py_logger.info("WAIT: %s: %s", title, details)
+        else:
+            self.py_logger.info("WAIT: %s", title)
 
     def custom(self, emoji_key: str, title: str, details: str = "") -> None:
         """Log custom message with specific emoji"""
+        if self._suppressed(logging.INFO):
+            return
         message = self._format_message(emoji_key, title, details)
         self.log_callback(message)
-        self.py_logger.info(
-            f"CUSTOM: {title}: {details}" if details else f"CUSTOM: {title}"
-        )
+        if details:
+            self.py_logger.info("CUSTOM: %s: %s", title, details)
+        else:
+            self.py_logger.info("CUSTOM: %s", title)
 
     def section_header(self, title: str) -> None:
         """Log a section header with visual separator"""
-        separator = "=" * 60
-        self.log_callback(separator)
-        self.log_callback(f"🚀 {title}")
-        self.log_callback(separator)
+        # One callback with the separators baked in, not three
+        self.log_callback(f"{self._SECTION_SEP}\n🚀 {title}\n{self._SECTION_SEP}")
 
     def sub_header(self, title: str) -> None:
         """Log a sub-section header"""
-        separator = "-" * 40
-        self.log_callback(separator)
-        self.log_callback(f"📋 {title}")
-        self.log_callback(separator)
+        self.log_callback(f"{self._SUB_SEP}\n📋 {title}\n{self._SUB_SEP}")
 
     def summary(self, items: list[tuple[str, Any]]) -> None:
         """Log a summary with key-value pairs"""
-        self.log_callback("📊 Summary:")
-        for key, value in items:
-            self.log_callback(f"   {key}: {value}")
+        # One joined message and one callback call instead of one per item
+        lines = ["📊 Summary:"]
+        lines.extend(f"   {key}: {value}" for key, value in items)
+        self.log_callback("\n".join(lines))
+
+
+# Bounded flyweight cache (LRU) so repeated factory calls in request loops
+# reuse one instance per (module, callback) pair instead of re-running
+# __init__. The cached logger holds a reference to its callback, keeping
+# the id key stable for as long as the entry lives; evicting the oldest
+# entry drops both together, so per-request closures stop accumulating
+_LOGGER_CACHE: OrderedDict[tuple[str, Optional[int]], ScraperLogger] = OrderedDict()
+_LOGGER_CACHE_MAX = 256
 
 
 # Convenience functions for backward compatibility
 def create_logger(
     module_name: str, log_callback: Optional[Callable[[str], None]] = None
 ) -> ScraperLogger:
-    """Create a standardized logger instance"""
-    return ScraperLogger(module_name, log_callback)
+    """Create (or reuse) a standardized logger instance"""
+    key = (module_name, id(log_callback) if log_callback is not None else None)
+    logger = _LOGGER_CACHE.get(key)
+    if logger is None:
+        logger = _LOGGER_CACHE[key] = ScraperLogger(module_name, log_callback)
+        if len(_LOGGER_CACHE) > _LOGGER_CACHE_MAX:
+            _LOGGER_CACHE.popitem(last=False)
+    else:
+        _LOGGER_CACHE.move_to_end(key)
+    return logger
 
 
 def migrate_log_callback(
@@ -285,4 +556,4 @@ def migrate_log_callback(
     Returns:
         Configured ScraperLogger instance
     """
-    return ScraperLogger(module_name, log_callback)
+    return create_logger(module_name, log_callback)